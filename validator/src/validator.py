@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 # validator.py — reporte de estándares Oracle (solo reporta, NO corrige)
-# Ajustes: intent routing + STDIN + plantillas SIN-ANÁLISIS.
+# Ajustes: intent routing + STDIN + plantillas SIN-ANÁLISIS + multi-policy.
 
-import sys, os, re, json, pathlib
+import sys, os, re, json, pathlib, bisect, fnmatch, time
+from collections import Counter
 from typing import List, Dict, Any, Tuple, Optional
 
+try:
+    import inotify_simple  # opcional: despierta el modo --watch sin esperar al sondeo
+except Exception:
+    inotify_simple = None
+
 # ---------- Utilidades ----------
 
 def read_text_utf8_nobom(path: str) -> str:
@@ -17,8 +23,15 @@ def file_exists(path: str) -> bool:
     except Exception:
         return False
 
-def line_no(text: str, idx: int) -> int:
-    return text.count("\n", 0, max(0, idx)) + 1
+def line_starts(text: str) -> List[int]:
+    # Índice de saltos de línea: se calcula una vez por texto y se pasa a
+    # todas las reglas (y todas las policies) que lo escanean.
+    return [m.start() for m in re.finditer("\n", text)]
+
+def line_no(text: str, idx: int, starts: Optional[List[int]] = None) -> int:
+    if starts is None:
+        return text.count("\n", 0, max(0, idx)) + 1
+    return bisect.bisect_left(starts, max(0, idx)) + 1
 
 def read_stdin_text() -> str:
     try:
@@ -33,7 +46,8 @@ def read_stdin_text() -> str:
 TEMPLATE_HELP = """Veredicto: SIN-ANÁLISIS
 Soy Validator CyGD. Valido SQL/PLSQL Oracle, SQL Server, PostgreSQL, PowerShell, XML e IPC.
 Cómo usar:
-1) Ejecuta: validator.py <policy.json> <archivo1.sql> [archivo2.sql ...]
+1) Ejecuta: validator.py <policy.json> [-p <policy2.json> ...] <archivo1.sql> [archivo2.sql ...]
+   (o bien: validator.py -p <policy1.json> -p <policy2.json> <archivo1.sql> ...)
 2) O bien pasa el código por STDIN:  echo \"```sql\\nCREATE TABLE T(...);\\n```\" | validator.py <policy.json>
 3) Opcional: agrega engine/versión/tablespace/esquema destino en tu policy.
 
@@ -112,9 +126,82 @@ def load_policy(policy_path: str) -> Dict[str, Any]:
     raw = read_text_utf8_nobom(policy_path)
     return json.loads(raw)
 
+def load_policies(policy_paths: List[str]) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[str], List[str]]:
+    """
+    Carga varias policies. Un manifiesto es un JSON con {"policies": [rutas...]};
+    sus rutas relativas se resuelven contra el directorio del manifiesto.
+    Devuelve pares (nombre, policy) en orden y sin duplicados, la lista de
+    archivos leídos (manifiestos y miembros) para que --watch los vigile y la
+    ruta absoluta de cada policy cargada (identificador único, mismo orden).
+    """
+    loaded: List[Tuple[str, Dict[str, Any]]] = []
+    sources: List[str] = []
+    origins: List[str] = []
+    seen = set()
+    pending = list(policy_paths)
+    while pending:
+        path = pending.pop(0)
+        key = os.path.abspath(path)
+        if key in seen:
+            continue
+        seen.add(key)
+        if not file_exists(path):
+            raise FileNotFoundError(f"Policy no encontrada: {path}")
+        sources.append(path)
+        policy = load_policy(path)
+        members = policy.get("policies") if isinstance(policy, dict) else None
+        if isinstance(members, list):
+            base = os.path.dirname(path)
+            pending[0:0] = [m if os.path.isabs(m) else os.path.join(base, m) for m in members]
+            continue
+        loaded.append((policy.get("name") or os.path.basename(path), policy))
+        origins.append(key)
+    return _disambiguate(loaded, origins), sources, origins
+
+def _disambiguate(loaded: List[Tuple[str, Dict[str, Any]]], origins: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Nombres repetidos (p.ej. policy_ip.json y validator/policy_ip.json) se
+    distinguen con la ruta relativa al directorio actual.
+    """
+    names = [n for n, _ in loaded]
+    out: List[Tuple[str, Dict[str, Any]]] = []
+    for (name, policy), origin in zip(loaded, origins):
+        if names.count(name) > 1:
+            try:
+                rel = os.path.relpath(origin)
+            except ValueError:  # otra unidad en Windows
+                rel = origin
+            name = rel if name == os.path.basename(origin) else f"{name} ({rel})"
+        out.append((name, policy))
+    return out
+
+def _glob_match(target: str, pattern: str) -> bool:
+    path = target.replace("\\", "/")
+    if fnmatch.fnmatch(path, pattern):
+        return True
+    # "**/*.sql" también debe cubrir archivos en la raíz.
+    while pattern.startswith("**/"):
+        pattern = pattern[3:]
+    return fnmatch.fnmatch(os.path.basename(path), pattern)
+
+def policy_skips(policy: Dict[str, Any], target: str) -> bool:
+    """Exclusión explícita por skip_patterns (regex) de la policy."""
+    return any(re.search(p, target, flags=re.I) for p in policy.get("skip_patterns") or [])
+
+def policy_applies(policy: Dict[str, Any], target: str, dispatch: bool = True) -> bool:
+    """
+    Despacho por archivo: sin file_match la policy aplica a todo;
+    con file_match sólo a los archivos que coinciden con algún glob.
+    Con dispatch=False (una sola policy, forma clásica) file_match no filtra.
+    """
+    if policy_skips(policy, target):
+        return False
+    globs = policy.get("file_match") or []
+    return not dispatch or not globs or any(_glob_match(target, g) for g in globs)
+
 # ---------- Reglas ----------
 
-def check_insert_columns(text: str, require: bool) -> List[Dict[str, Any]]]:
+def check_insert_columns(text: str, require: bool, starts: Optional[List[int]] = None) -> List[Dict[str, Any]]:
     """
     INSERT INTO <obj> (...)  -> exige lista de columnas.
     """
@@ -126,10 +213,10 @@ def check_insert_columns(text: str, require: bool) -> List[Dict[str, Any]]]:
         while j < len(text) and text[j] in " \t\r\n":
             j += 1
         if j >= len(text) or text[j] != "(":
-            ln1 = line_no(text, m.start())
+            ln1 = line_no(text, m.start(), starts)
             tail = text[m.start(): m.start() + 400]
             mv = re.search(r"\b(values|select)\b", tail, flags=re.I)
-            ln2 = line_no(text, m.start() + (mv.end() if mv else 0))
+            ln2 = line_no(text, m.start() + (mv.end() if mv else 0), starts)
             issues.append({
                 "code": "INSERT-COLS",
                 "desc": "INSERT debe declarar columnas destino",
@@ -137,7 +224,7 @@ def check_insert_columns(text: str, require: bool) -> List[Dict[str, Any]]]:
             })
     return issues
 
-def check_exception_prefix(text: str, prefix: str) -> List[Dict[str, Any]]:
+def check_exception_prefix(text: str, prefix: str, starts: Optional[List[int]] = None) -> List[Dict[str, Any]]:
     """
     Excepciones declaradas deben iniciar con un prefijo (p.ej. EXC_).
     """
@@ -150,12 +237,12 @@ def check_exception_prefix(text: str, prefix: str) -> List[Dict[str, Any]]:
             issues.append({
                 "code": "EXC-PREFIX",
                 "desc": f"Excepciones deben iniciar con {prefix}",
-                "ls": line_no(text, m.start()),
-                "le": line_no(text, m.start())
+                "ls": line_no(text, m.start(), starts),
+                "le": line_no(text, m.start(), starts)
             })
     return issues
 
-def check_select_star(text: str, forbid: bool) -> List[Dict[str, Any]]:
+def check_select_star(text: str, forbid: bool, starts: Optional[List[int]] = None) -> List[Dict[str, Any]]:
     """
     Prohíbe SELECT *.
     """
@@ -163,7 +250,7 @@ def check_select_star(text: str, forbid: bool) -> List[Dict[str, Any]]:
         return []
     issues = []
     for m in re.finditer(r"\bselect\s*(?:/\*.*?\*/\s*)*\*\s*from\b", text, flags=re.I|re.S):
-        ln = line_no(text, m.start())
+        ln = line_no(text, m.start(), starts)
         issues.append({
             "code": "SELECT-STAR",
             "desc": "Evitar SELECT *; lista columnas explícitas",
@@ -171,7 +258,7 @@ def check_select_star(text: str, forbid: bool) -> List[Dict[str, Any]]:
         })
     return issues
 
-def check_forbidden_keywords(text: str, keywords: List[str]) -> List[Dict[str, Any]]:
+def check_forbidden_keywords(text: str, keywords: List[str], starts: Optional[List[int]] = None) -> List[Dict[str, Any]]:
     """
     Palabras clave prohibidas (simples).
     """
@@ -182,7 +269,7 @@ def check_forbidden_keywords(text: str, keywords: List[str]) -> List[Dict[str, A
             continue
         pat = r"\b" + re.escape(kw) + r"\b"
         for m in re.finditer(pat, text, flags=re.I):
-            ln = line_no(text, m.start())
+            ln = line_no(text, m.start(), starts)
             issues.append({
                 "code": "KW-FORBIDDEN",
                 "desc": f"Keyword prohibido: {kw}",
@@ -211,12 +298,12 @@ def check_bitacora(text: str, cfg: Dict[str, str]) -> List[Dict[str, Any]]:
             })
     return issues
 
-def check_order_by_position(text: str, forbid: bool) -> List[Dict[str, Any]]:
+def check_order_by_position(text: str, forbid: bool, starts: Optional[List[int]] = None) -> List[Dict[str, Any]]:
     if not forbid:
         return []
     issues = []
     for m in re.finditer(r"\border\s+by\s+\d+(?:\s*,\s*\d+)*\b", text, flags=re.I):
-        ln = line_no(text, m.start())
+        ln = line_no(text, m.start(), starts)
         issues.append({
             "code": "ORD-BY-NUM",
             "desc": "Evita ORDER BY por posición; usa columnas explícitas",
@@ -224,13 +311,13 @@ def check_order_by_position(text: str, forbid: bool) -> List[Dict[str, Any]]:
         })
     return issues
 
-def check_update_delete_where(text: str, enforce_update: bool, enforce_delete: bool) -> List[Dict[str, Any]]:
+def check_update_delete_where(text: str, enforce_update: bool, enforce_delete: bool, starts: Optional[List[int]] = None) -> List[Dict[str, Any]]:
     issues = []
     if enforce_update:
         for m in re.finditer(r"\bupdate\b[\s\S]*?;", text, flags=re.I):
             frag = text[m.start():m.end()]
             if re.search(r"\bwhere\b", frag, flags=re.I) is None:
-                ln = line_no(text, m.start())
+                ln = line_no(text, m.start(), starts)
                 issues.append({
                     "code": "UPDATE-WHERE",
                     "desc": "UPDATE sin WHERE",
@@ -240,7 +327,7 @@ def check_update_delete_where(text: str, enforce_update: bool, enforce_delete: b
         for m in re.finditer(r"\bdelete\b[\s\S]*?;", text, flags=re.I):
             frag = text[m.start():m.end()]
             if re.search(r"\bwhere\b", frag, flags=re.I) is None and re.search(r"\btruncate\b", frag, flags=re.I) is None:
-                ln = line_no(text, m.start())
+                ln = line_no(text, m.start(), starts)
                 issues.append({
                     "code": "DELETE-WHERE",
                     "desc": "DELETE sin WHERE",
@@ -250,8 +337,10 @@ def check_update_delete_where(text: str, enforce_update: bool, enforce_delete: b
 
 # ---------- Aplicación de reglas sobre texto ----------
 
-def apply_rules_to_text(text: str, policy: Dict[str, Any]) -> List[Dict[str, Any]]:
+def apply_rules_to_text(text: str, policy: Dict[str, Any], starts: Optional[List[int]] = None) -> List[Dict[str, Any]]:
     issues: List[Dict[str, Any]] = []
+    if starts is None:
+        starts = line_starts(text)
 
     # Parámetros de policy (opcionales)
     require_insert_cols = policy.get("require_insert_column_list", False)
@@ -264,28 +353,64 @@ def apply_rules_to_text(text: str, policy: Dict[str, Any]) -> List[Dict[str, Any
     enforce_del_where   = policy.get("require_where_delete", False)
 
     # Aplicar reglas
-    issues += check_insert_columns(text, require_insert_cols)
-    issues += check_exception_prefix(text, exc_prefix)
-    issues += check_select_star(text, forbid_star)
+    issues += check_insert_columns(text, require_insert_cols, starts)
+    issues += check_exception_prefix(text, exc_prefix, starts)
+    issues += check_select_star(text, forbid_star, starts)
     if forbid_kws:
-        issues += check_forbidden_keywords(text, forbid_kws)
+        issues += check_forbidden_keywords(text, forbid_kws, starts)
     issues += check_bitacora(text, bitacora_cfg)
-    issues += check_order_by_position(text, forbid_ord_pos)
-    issues += check_update_delete_where(text, enforce_upd_where, enforce_del_where)
+    issues += check_order_by_position(text, forbid_ord_pos, starts)
+    issues += check_update_delete_where(text, enforce_upd_where, enforce_del_where, starts)
 
     return issues
 
-# ---------- Reporte ----------
+def validate_file(target: str, policies: List[Tuple[str, Dict[str, Any]]]) -> Optional[List[List[Dict[str, Any]]]]:
+    """
+    Lee el archivo una vez y lo valida contra las policies que le aplican.
+    file_match sólo despacha cuando hay varias policies. Devuelve los hallazgos
+    por policy (mismo orden que `policies`) o None si no aplica ninguna o no
+    se pudo leer; un archivo que nadie revisó se avisa, nunca cuenta como CUMPLE.
+    """
+    applicable = _applicable(target, policies)
+    if not applicable:
+        return None
 
-def emit_report(all_issues: Dict[str, List[Dict[str, Any]]], policy: Dict[str, Any]) -> int:
-    total = sum(len(v) for v in all_issues.values())
-    prefix = (policy.get("output") or {}).get("prefix", "Veredicto: ")
-    if total == 0:
-        print(prefix + "CUMPLE")
-        return 0
+    try:
+        text = read_text_utf8_nobom(target)
+    except Exception as e:
+        print(f"- [warn] no se pudo leer {target}: {e}")
+        return None
+
+    return _apply_policies(text, policies, applicable)
+
+def validate_stdin(text: str, policies: List[Tuple[str, Dict[str, Any]]],
+                   name: str = "stdin.sql") -> Optional[List[List[Dict[str, Any]]]]:
+    """STDIN se despacha como un archivo llamado `name` (file_match incluido)."""
+    applicable = _applicable(name, policies)
+    if not applicable:
+        return None
+    return _apply_policies(text, policies, applicable)
+
+def _applicable(target: str, policies: List[Tuple[str, Dict[str, Any]]]) -> List[int]:
+    dispatch = len(policies) > 1
+    applicable = [k for k, (_, policy) in enumerate(policies) if policy_applies(policy, target, dispatch)]
+    if not applicable and not all(policy_skips(policy, target) for _, policy in policies):
+        print(f"- [warn] ninguna policy aplica a {target}")
+    return applicable
+
+def _apply_policies(text: str, policies: List[Tuple[str, Dict[str, Any]]],
+                    applicable: List[int]) -> List[List[Dict[str, Any]]]:
+    # Se comparten la lectura y el índice de líneas; cada policy corre sus
+    # propias reglas (no hay un escaneo combinado entre policies).
+    starts = line_starts(text)
+    found: List[List[Dict[str, Any]]] = [[] for _ in policies]
+    for k in applicable:
+        found[k] = apply_rules_to_text(text, policies[k][1], starts)
+    return found
 
-    print(f"{prefix}NO CUMPLE [{total} hallazgos]")
+# ---------- Reporte ----------
 
+def _print_issues(all_issues: Dict[str, List[Dict[str, Any]]], policy: Dict[str, Any]) -> None:
     doc_refs = policy.get("doc_refs", {}) or {}
     notes = policy.get("remediation_notes", {}) or {}
 
@@ -304,10 +429,302 @@ def emit_report(all_issues: Dict[str, List[Dict[str, Any]]], policy: Dict[str, A
             note = notes.get(it["code"]) or notes.get(it["code"].split(":")[0])
             if note:
                 print(f"  Cómo corregir: {note}")
+
+def emit_report(all_issues: Dict[str, List[Dict[str, Any]]], policy: Dict[str, Any]) -> int:
+    total = sum(len(v) for v in all_issues.values())
+    prefix = (policy.get("output") or {}).get("prefix", "Veredicto: ")
+    if total == 0:
+        print(prefix + "CUMPLE")
+        return 0
+
+    print(f"{prefix}NO CUMPLE [{total} hallazgos]")
+    _print_issues(all_issues, policy)
     return 1
 
+def emit_multi_report(results: List[Tuple[str, Dict[str, Any], Dict[str, List[Dict[str, Any]]]]]) -> int:
+    """
+    Veredicto consolidado + una sección por policy (nombre, veredicto, hallazgos).
+    """
+    prefix = (results[0][1].get("output") or {}).get("prefix", "Veredicto: ") if results else "Veredicto: "
+    total = sum(len(v) for _, _, issues in results for v in issues.values())
+    if total == 0:
+        print(prefix + "CUMPLE")
+    else:
+        print(f"{prefix}NO CUMPLE [{total} hallazgos]")
+
+    for name, policy, issues in results:
+        n = sum(len(v) for v in issues.values())
+        print(f"\n== Policy: {name} — " + (f"NO CUMPLE [{n} hallazgos]" if n else "CUMPLE"))
+        _print_issues(issues, policy)
+    return 1 if total else 0
+
+# ---------- Watch (desarrollo local / ATTACHMENTS_DIR) ----------
+
+WATCH_INTERVAL = 0.5   # segundos entre sondeos
+WATCH_DEBOUNCE = 0.2   # espera a que una ráfaga de guardados termine
+WATCH_EXTS = {".sql", ".pkb", ".pks", ".pls", ".txt", ".xml", ".prm", ".ddl", ".pkg", ".ps1", ".ipc"}
+WATCH_SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "node_modules"}
+
+def _expand_targets(targets: List[str]) -> List[str]:
+    """Archivos explícitos tal cual; directorios se recorren filtrando por WATCH_EXTS."""
+    files: List[str] = []
+    for t in targets:
+        if os.path.isdir(t):
+            for root, dirs, names in os.walk(t):
+                dirs[:] = [d for d in dirs if d not in WATCH_SKIP_DIRS]
+                files += [os.path.join(root, n) for n in names
+                          if os.path.splitext(n)[1].lower() in WATCH_EXTS]
+        else:
+            files.append(t)
+    return files
+
+def _snapshot(paths: List[str]) -> Dict[str, Tuple[int, int]]:
+    snap: Dict[str, Tuple[int, int]] = {}
+    for p in paths:
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        snap[p] = (st.st_mtime_ns, st.st_size)
+    return snap
+
+def _finding_key(origin: str, it: Dict[str, Any]) -> Tuple[str, str, str, int, int]:
+    return (origin, it["code"], it["desc"], it["ls"], it["le"])
+
+def _findings(found: Optional[List[List[Dict[str, Any]]]], origins: List[str]) -> Counter:
+    # Multiconjunto por policy (ruta absoluta, no el nombre visible, que
+    # puede repetirse): dos hallazgos iguales en la misma línea cuentan dos veces.
+    out: Counter = Counter()
+    for origin, issues in zip(origins, found or []):
+        for it in issues:
+            out[_finding_key(origin, it)] += 1
+    return out
+
+def _print_diff(target: str, before: Counter, after: Counter, labels: Optional[Dict[str, str]]) -> None:
+    """labels: ruta de policy -> nombre a mostrar; None con una sola policy."""
+    new = list((after - before).elements())
+    gone = list((before - after).elements())
+    print(f"\n[{target}] +{len(new)} nuevos, -{len(gone)} resueltos")
+    for sign, keys in (("+", new), ("-", gone)):
+        for origin, code, desc, ls, le in sorted(keys, key=lambda k: (k[3], k[1])):
+            rng = f"L{ls}" + (f"–{le}" if le != ls else "")
+            origin = f" ({labels.get(origin, origin)})" if labels is not None else ""
+            print(f"  {sign} {rng} {code} — {desc}{origin}")
+
+class _Waker:
+    """
+    Espera entre sondeos. Con inotify_simple disponible despierta en cuanto
+    cambia algo en los directorios vigilados; si no, duerme `interval`.
+    """
+    def __init__(self, targets: List[str], interval: float):
+        self.interval = interval
+        self.inotify = None
+        if inotify_simple is None:
+            return
+        try:
+            fl = inotify_simple.flags
+            mask = fl.CLOSE_WRITE | fl.MODIFY | fl.CREATE | fl.DELETE | fl.MOVED_TO | fl.MOVED_FROM
+            self.inotify = inotify_simple.INotify()
+            dirs = set()
+            for t in targets:
+                if os.path.isdir(t):
+                    for root, sub, _ in os.walk(t):
+                        sub[:] = [d for d in sub if d not in WATCH_SKIP_DIRS]
+                        dirs.add(root)
+                else:
+                    dirs.add(os.path.dirname(os.path.abspath(t)))
+            for d in dirs:
+                self.inotify.add_watch(d, mask)
+        except Exception:
+            self.inotify = None
+
+    def close(self) -> None:
+        if self.inotify is not None:
+            try:
+                self.inotify.close()
+            except Exception:
+                pass
+            self.inotify = None
+
+    def wait(self) -> None:
+        if self.inotify is None:
+            time.sleep(self.interval)
+            return
+        try:
+            self.inotify.read(timeout=int(self.interval * 1000))
+        except Exception:
+            time.sleep(self.interval)
+
+class WatchSession:
+    """
+    Estado en memoria del modo --watch: policies cargadas, último snapshot
+    (mtime, tamaño) de archivos y policies, y hallazgos vigentes por archivo.
+    tick() hace una pasada completa sin bucle ni esperas.
+    """
+    def __init__(self, policy_paths: List[str], policies: List[Tuple[str, Dict[str, Any]]],
+                 policy_sources: List[str], policy_origins: List[str], targets: List[str]):
+        self.policy_paths = policy_paths
+        self.policies = policies
+        self.policy_sources = policy_sources
+        self.policy_origins = policy_origins
+        self.labels: Dict[str, str] = {}
+        self.targets = targets
+        self.snap: Dict[str, Tuple[int, int]] = {}
+        self.pol_snap = _snapshot(policy_sources)
+        self.state: Dict[str, Counter] = {}
+
+    @property
+    def multi(self) -> bool:
+        return len(self.policies) > 1
+
+    def _labels(self) -> Optional[Dict[str, str]]:
+        # Acumula nombres de policies ya retiradas para poder mostrarlas como resueltas.
+        self.labels.update({o: n for o, (n, _) in zip(self.policy_origins, self.policies)})
+        return self.labels if self.multi else None
+
+    def poll(self) -> Tuple[Dict[str, Tuple[int, int]], Dict[str, Tuple[int, int]]]:
+        return _snapshot(_expand_targets(self.targets)), _snapshot(self.policy_sources)
+
+    def unchanged(self, cur: Dict[str, Tuple[int, int]], cur_pol: Dict[str, Tuple[int, int]]) -> bool:
+        return cur == self.snap and cur_pol == self.pol_snap
+
+    def initial_report(self) -> int:
+        self.snap = _snapshot(_expand_targets(self.targets))
+        per_policy: List[Dict[str, List[Dict[str, Any]]]] = [{} for _ in self.policies]
+        for f in self.snap:
+            found = validate_file(f, self.policies)
+            self.state[f] = _findings(found, self.policy_origins)
+            for k, issues in enumerate(found or []):
+                if issues:
+                    per_policy[k][f] = issues
+        if self.multi:
+            return emit_multi_report([(n, p, i) for (n, p), i in zip(self.policies, per_policy)])
+        return emit_report(per_policy[0], self.policies[0][1])
+
+    def apply(self, cur: Dict[str, Tuple[int, int]], cur_pol: Dict[str, Tuple[int, int]]) -> bool:
+        """Revalida lo que cambió entre el snapshot guardado y (cur, cur_pol)."""
+        if self.unchanged(cur, cur_pol):
+            return False
+
+        changed = [f for f in cur if self.snap.get(f) != cur[f]]
+        if cur_pol != self.pol_snap:
+            try:
+                policies, sources, origins = load_policies(self.policy_paths)
+                if not policies:
+                    raise ValueError("el manifiesto no declara policies")
+                self.policies, self.policy_sources, self.policy_origins = policies, sources, origins
+                cur_pol = _snapshot(self.policy_sources)
+                print("\n[watch] policy recargada; revalidando todo")
+                changed = list(cur)
+            except Exception as e:
+                print(f"\n- [warn] policy inválida, se conserva la anterior: {e}")
+            self.pol_snap = cur_pol
+
+        t0 = time.perf_counter()
+        labels = self._labels()
+        for f in changed:
+            after = _findings(validate_file(f, self.policies), self.policy_origins)
+            _print_diff(f, self.state.get(f, Counter()), after, labels)
+            self.state[f] = after
+        for f in [f for f in self.snap if f not in cur]:
+            _print_diff(f, self.state.pop(f, Counter()), Counter(), labels)
+        self.snap = cur
+
+        total = sum(sum(c.values()) for c in self.state.values())
+        verdict = f"NO CUMPLE [{total} hallazgos]" if total else "CUMPLE"
+        ms = (time.perf_counter() - t0) * 1000
+        print(f"[watch] Veredicto: {verdict} ({ms:.0f} ms)")
+        sys.stdout.flush()
+        return True
+
+    def tick(self) -> bool:
+        return self.apply(*self.poll())
+
+def watch(policy_paths: List[str], policies: List[Tuple[str, Dict[str, Any]]], policy_sources: List[str],
+          policy_origins: List[str], targets: List[str], interval: float = WATCH_INTERVAL) -> int:
+    """
+    Valida todo una vez y luego sondea mtime/tamaño: sólo se revalidan los
+    archivos que cambiaron, con las policies ya cargadas en memoria. Por cada
+    cambio imprime los hallazgos nuevos (+) y resueltos (-). Si cambia una
+    policy (o un miembro de un manifiesto) se recarga y se revalida todo.
+    Termina con Ctrl+C.
+    """
+    session = WatchSession(policy_paths, policies, policy_sources, policy_origins, targets)
+    session.initial_report()
+
+    waker = _Waker(targets + session.policy_sources, interval)
+    print(f"\n[watch] vigilando {len(session.snap)} archivos (Ctrl+C para salir)")
+    sys.stdout.flush()
+    try:
+        while True:
+            waker.wait()
+            cur, cur_pol = session.poll()
+            if session.unchanged(cur, cur_pol):
+                continue
+
+            # Debounce: espera a que la ráfaga de guardados se estabilice.
+            while True:
+                time.sleep(WATCH_DEBOUNCE)
+                nxt, nxt_pol = session.poll()
+                if nxt == cur and nxt_pol == cur_pol:
+                    break
+                cur, cur_pol = nxt, nxt_pol
+
+            sources = session.policy_sources
+            session.apply(cur, cur_pol)
+            if session.policy_sources != sources:
+                # Un manifiesto recargado puede traer miembros en otros directorios.
+                waker.close()
+                waker = _Waker(targets + session.policy_sources, interval)
+    except KeyboardInterrupt:
+        print("\n[watch] fin")
+        return 0
+    finally:
+        waker.close()
+
 # ---------- MAIN ----------
 
+USAGE = ("Uso: validator.py <policy.json> [-p <policy2.json> ...] [--watch [--interval=SEG]] "
+         "<archivo1.sql|dir> [archivo2.sql ...]  (o sólo -p <policy> ... sin policy posicional)")
+
+def parse_args(argv: List[str]) -> Tuple[List[str], List[str], Dict[str, Any]]:
+    """
+    Separa policies, archivos y opciones. El primer argumento posicional es
+    policy si aparece antes de cualquier -p/--policy (forma clásica); después,
+    -p/--policy (repetible) agrega más. Opciones: --watch, --interval=SEG.
+    """
+    policies: List[str] = []
+    positional: List[str] = []
+    leading = True  # aún puede llegar la policy posicional
+    opts: Dict[str, Any] = {"watch": False, "interval": WATCH_INTERVAL}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-p", "--policy"):
+            if i + 1 >= len(argv):
+                raise ValueError(f"{arg} requiere una ruta de policy")
+            policies.append(argv[i + 1])
+            leading = False
+            i += 2
+            continue
+        if arg.startswith("--policy="):
+            policies.append(arg.split("=", 1)[1])
+            leading = False
+        elif arg == "--watch":
+            opts["watch"] = True
+        elif arg.startswith("--interval="):
+            try:
+                opts["interval"] = max(0.05, float(arg.split("=", 1)[1]))
+            except ValueError:
+                raise ValueError(f"--interval inválido: {arg.split('=', 1)[1]}")
+        elif leading:
+            policies.append(arg)
+            leading = False
+        else:
+            positional.append(arg)
+        i += 1
+    return policies, positional, opts
+
 def main():
     stdin_text = read_stdin_text()
 
@@ -319,24 +736,45 @@ def main():
             sys.exit(0)
         # Quiere validar pero falta policy ⇒ error de uso.
         print("Veredicto: NO CUMPLE")
-        print("- [error] Uso: validator.py <policy.json> <archivo1.sql> [archivo2.sql ...]")
+        print(f"- [error] {USAGE}")
         sys.exit(2)
 
-    policy_path = sys.argv[1]
-    targets = sys.argv[2:]
-
-    if not file_exists(policy_path):
+    try:
+        policy_paths, targets, opts = parse_args(sys.argv[1:])
+    except ValueError as e:
         print("Veredicto: NO CUMPLE")
-        print(f"- [error] Policy no encontrada: {policy_path}")
+        print(f"- [error] {e}. {USAGE}")
         sys.exit(2)
 
     try:
-        policy = load_policy(policy_path)
+        policies, policy_sources, policy_origins = load_policies(policy_paths)
+    except FileNotFoundError as e:
+        print("Veredicto: NO CUMPLE")
+        print(f"- [error] {e}")
+        sys.exit(2)
     except Exception as e:
         print("Veredicto: NO CUMPLE")
         print(f"- [error] Policy inválida: {e}")
         sys.exit(2)
 
+    if not policies:
+        print("Veredicto: NO CUMPLE")
+        print("- [error] El manifiesto no declara policies")
+        sys.exit(2)
+
+    # Una sola policy conserva el reporte clásico; varias, el consolidado.
+    def report(per_policy: List[Dict[str, List[Dict[str, Any]]]]) -> int:
+        if len(policies) == 1:
+            return emit_report(per_policy[0], policies[0][1])
+        return emit_multi_report([(n, p, i) for (n, p), i in zip(policies, per_policy)])
+
+    if opts["watch"]:
+        if not targets:
+            print("Veredicto: NO CUMPLE")
+            print(f"- [error] --watch requiere archivos o directorios. {USAGE}")
+            sys.exit(2)
+        sys.exit(watch(policy_paths, policies, policy_sources, policy_origins, targets, opts["interval"]))
+
     # Caso: sin archivos, pero viene algo por STDIN.
     if not targets and stdin_text:
         intent = detect_intent(stdin_text)
@@ -347,39 +785,25 @@ def main():
             print(TEMPLATE_NO_CODE)
             sys.exit(0)
 
-        issues = apply_rules_to_text(stdin_text, policy)
-        all_issues = {"stdin.sql": issues} if issues else {}
-        exit_code = emit_report(all_issues, policy)
-        sys.exit(exit_code)
+        found = validate_stdin(stdin_text, policies)
+        per_policy = [{"stdin.sql": issues} if issues else {} for issues in (found or [[] for _ in policies])]
+        sys.exit(report(per_policy))
 
-    # Caso: archivos en argumentos
-    # Exclusiones opcionales por regex
-    skip_patterns = policy.get("skip_patterns", [])
-    skip_res = [re.compile(p, flags=re.I) for p in skip_patterns] if skip_patterns else []
-
-    all_issues: Dict[str, List[Dict[str, Any]]] = {}
+    # Caso: archivos en argumentos. Cada archivo se lee una vez y se
+    # despacha a las policies que le aplican (file_match / skip_patterns).
+    per_policy: List[Dict[str, List[Dict[str, Any]]]] = [{} for _ in policies]
 
     for target in targets:
         if not file_exists(target):
             print(f"- [warn] archivo no encontrado: {target}")
             continue
 
-        # saltar por patrón si aplica
-        if skip_res and any(r.search(target) for r in skip_res):
-            continue
-
-        try:
-            text = read_text_utf8_nobom(target)
-        except Exception as e:
-            print(f"- [warn] no se pudo leer {target}: {e}")
-            continue
-
-        issues = apply_rules_to_text(text, policy)
-        if issues:
-            all_issues[os.path.basename(target)] = issues
+        found = validate_file(target, policies)
+        for k, issues in enumerate(found or []):
+            if issues:
+                per_policy[k][os.path.basename(target)] = issues
 
-    exit_code = emit_report(all_issues, policy)
-    sys.exit(exit_code)
+    sys.exit(report(per_policy))
 
 if __name__ == "__main__":
     main()
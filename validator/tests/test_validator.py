@@ -0,0 +1,196 @@
+# test_validator.py — pruebas del CLI validator/src/validator.py
+import importlib.util
+import json
+import os
+import pathlib
+
+import pytest
+
+_SRC = pathlib.Path(__file__).resolve().parents[1] / "src" / "validator.py"
+_spec = importlib.util.spec_from_file_location("validator_cli", _SRC)
+v = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(v)
+
+
+# ---------- parse_args ----------
+
+@pytest.mark.parametrize("argv, policies, targets", [
+    (["a.json", "x.sql"], ["a.json"], ["x.sql"]),
+    (["a.json", "-p", "b.json", "x.sql"], ["a.json", "b.json"], ["x.sql"]),
+    (["-p", "a.json", "--policy=b.json", "x.sql", "y.sql"], ["a.json", "b.json"], ["x.sql", "y.sql"]),
+    (["--watch", "a.json", "dir"], ["a.json"], ["dir"]),
+])
+def test_parse_args_policies_and_targets(argv, policies, targets):
+    got_policies, got_targets, _ = v.parse_args(argv)
+    assert got_policies == policies
+    assert got_targets == targets
+
+
+def test_parse_args_rejects_dangling_policy_flag():
+    with pytest.raises(ValueError):
+        v.parse_args(["a.json", "-p"])
+
+
+# ---------- Despacho por file_match ----------
+
+STAR = {"forbid_select_star": True, "file_match": ["**/*.sql"]}
+KW = {"forbid_keywords": ["Invoke-Expression"], "file_match": ["**/*.ps1"]}
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_single_policy_ignores_file_match(tmp_path):
+    target = _write(tmp_path / "y.pls", "SELECT * FROM t;\n")
+    found = v.validate_file(target, [("c.json", STAR)])
+    assert [it["code"] for it in found[0]] == ["SELECT-STAR"]
+
+
+def test_multi_policy_dispatches_by_file_match(tmp_path):
+    policies = [("a", STAR), ("b", KW)]
+    sql = _write(tmp_path / "q.sql", "SELECT * FROM t;\nInvoke-Expression 1\n")
+    ps1 = _write(tmp_path / "s.ps1", "SELECT * FROM t;\nInvoke-Expression 1\n")
+    assert [[it["code"] for it in f] for f in v.validate_file(sql, policies)] == [["SELECT-STAR"], []]
+    assert [[it["code"] for it in f] for f in v.validate_file(ps1, policies)] == [[], ["KW-FORBIDDEN"]]
+
+
+def test_unmatched_file_is_warned_not_passed(tmp_path, capsys):
+    target = _write(tmp_path / "y.pls", "SELECT * FROM t;\n")
+    assert v.validate_file(target, [("a", STAR), ("b", KW)]) is None
+    assert "ninguna policy aplica" in capsys.readouterr().out
+
+
+def test_skip_patterns_exclude_silently(tmp_path, capsys):
+    target = _write(tmp_path / "gen_y.sql", "SELECT * FROM t;\n")
+    policy = dict(STAR, skip_patterns=["gen_"])
+    assert v.validate_file(target, [("a", policy)]) is None
+    assert capsys.readouterr().out == ""
+
+
+# ---------- Índice de líneas ----------
+
+def test_line_no_with_index_matches_plain_count():
+    text = "a\nb\n\nc"
+    starts = v.line_starts(text)
+    for idx in range(-1, len(text) + 2):
+        assert v.line_no(text, idx, starts) == v.line_no(text, idx)
+
+
+# ---------- Modo --watch (una pasada por tick, sin bucle) ----------
+
+def _session(tmp_path, policy):
+    pol = tmp_path / "p.json"
+    pol.write_text(json.dumps(policy), encoding="utf-8")
+    manifest = _write(tmp_path / "m.json", json.dumps({"policies": ["p.json"]}))
+    src = tmp_path / "src"
+    src.mkdir()
+    policies, sources, origins = v.load_policies([manifest])
+    return v.WatchSession([manifest], policies, sources, origins, [str(src)]), src, pol
+
+
+def test_watch_tick_new_resolved_and_removed(tmp_path, capsys):
+    session, src, _ = _session(tmp_path, {"forbid_select_star": True})
+    f = _write(src / "x.sql", "SELECT a FROM t;\n")
+    assert session.initial_report() == 0
+    assert session.tick() is False
+
+    _write(src / "x.sql", "SELECT * FROM t;\n\n")
+    capsys.readouterr()
+    assert session.tick() is True
+    out = capsys.readouterr().out
+    assert "+1 nuevos, -0 resueltos" in out and "+ L1 SELECT-STAR" in out
+    assert "NO CUMPLE [1 hallazgos]" in out
+
+    _write(src / "x.sql", "SELECT a, b FROM t;\n")
+    session.tick()
+    out = capsys.readouterr().out
+    assert "+0 nuevos, -1 resueltos" in out and "- L1 SELECT-STAR" in out
+
+    _write(src / "x.sql", "SELECT * FROM t;\n")
+    session.tick()
+    capsys.readouterr()
+    os.remove(f)
+    session.tick()
+    out = capsys.readouterr().out
+    assert "-1 resueltos" in out and "[watch] Veredicto: CUMPLE" in out
+    assert f not in session.state
+
+
+def test_watch_tick_reloads_manifest_member(tmp_path, capsys):
+    session, src, pol = _session(tmp_path, {"forbid_select_star": True})
+    _write(src / "x.sql", "SELECT * FROM t;\n")
+    assert session.initial_report() == 1
+    capsys.readouterr()
+
+    pol.write_text(json.dumps({"forbid_select_star": False, "name": "relaxed"}), encoding="utf-8")
+    assert session.tick() is True
+    out = capsys.readouterr().out
+    assert "policy recargada" in out and "- L1 SELECT-STAR" in out
+    assert session.policies[0][0] == "relaxed"
+
+
+def test_watch_counts_duplicate_findings_on_one_line(tmp_path, capsys):
+    session, src, _ = _session(tmp_path, {"forbid_select_star": True})
+    _write(src / "x.sql", "SELECT a FROM a;\n")
+    session.initial_report()
+
+    _write(src / "x.sql", "SELECT * FROM a UNION ALL SELECT * FROM b;\n")
+    session.tick()
+    out = capsys.readouterr().out
+    assert "+2 nuevos, -0 resueltos" in out and "NO CUMPLE [2 hallazgos]" in out
+
+    _write(src / "x.sql", "SELECT * FROM a UNION ALL SELECT b FROM b;\n")
+    session.tick()
+    out = capsys.readouterr().out
+    assert "+0 nuevos, -1 resueltos" in out and "NO CUMPLE [1 hallazgos]" in out
+
+
+def test_watch_state_keeps_policies_with_same_name_apart(tmp_path, capsys):
+    for d in ("a", "b"):
+        (tmp_path / d).mkdir()
+        (tmp_path / d / "p.json").write_text(json.dumps({"forbid_select_star": True}), encoding="utf-8")
+    manifest = _write(tmp_path / "m.json", json.dumps({"policies": ["a/p.json", "b/p.json"]}))
+    src = tmp_path / "src"
+    src.mkdir()
+    _write(src / "x.sql", "SELECT * FROM t;\n")
+    policies, sources, origins = v.load_policies([manifest])
+    session = v.WatchSession([manifest], policies, sources, origins, [str(src)])
+
+    assert session.initial_report() == 1
+    assert "NO CUMPLE [2 hallazgos]" in capsys.readouterr().out
+    assert sum(sum(c.values()) for c in session.state.values()) == 2
+
+
+def test_load_policies_disambiguates_colliding_names(tmp_path, monkeypatch):
+    for d in ("a", "b"):
+        (tmp_path / d).mkdir()
+        (tmp_path / d / "p.json").write_text("{}", encoding="utf-8")
+    _write(tmp_path / "c.json", json.dumps({"name": "p.json"}))
+    _write(tmp_path / "d.json", json.dumps({"name": "solo"}))
+    monkeypatch.chdir(tmp_path)
+    policies, _, _ = v.load_policies(["a/p.json", "b/p.json", "c.json", "d.json"])
+    assert [n for n, _ in policies] == [
+        os.path.join("a", "p.json"), os.path.join("b", "p.json"), "p.json (c.json)", "solo"]
+
+
+def test_watch_rejects_reload_with_no_policies(tmp_path, capsys):
+    session, src, _ = _session(tmp_path, {"forbid_select_star": True})
+    _write(src / "x.sql", "SELECT * FROM t;\n")
+    session.initial_report()
+    capsys.readouterr()
+
+    _write(tmp_path / "m.json", json.dumps({"policies": []}))
+    assert session.tick() is True
+    out = capsys.readouterr().out
+    assert "policy inválida, se conserva la anterior" in out and "recargada" not in out
+    assert "NO CUMPLE [1 hallazgos]" in out and len(session.policies) == 1
+
+
+def test_stdin_is_dispatched_like_a_sql_file():
+    text = "SELECT * FROM t;\nInvoke-Expression 1\n"
+    found = v.validate_stdin(text, [("a", STAR), ("b", KW)])
+    assert [[it["code"] for it in f] for f in found] == [["SELECT-STAR"], []]
+    # Con una sola policy file_match no filtra (forma clásica).
+    assert [it["code"] for it in v.validate_stdin(text, [("b", KW)])[0]] == ["KW-FORBIDDEN"]
@@ -1,5 +1,5 @@
 # validator_integration.py
-import os, glob, subprocess, re, tempfile, sys
+import os, glob, subprocess, re, tempfile, sys, stat
 from pathlib import Path
 
 ALLOW_AUTOFIX = False
@@ -84,13 +84,18 @@ def _pick_file_by_name(message_text: str) -> str | None:
 
 def _find_attachment_file() -> str | None:
     d = Path(ATTACHMENTS_DIR)
-    if not d.exists(): return None
-    candidates = [p for p in d.iterdir() if p.is_file() and p.suffix.lower() in SUPPORTED_EXT]
-    if not candidates: return None
-    candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    path = candidates[0]
-    if path.stat().st_size > MAX_SIZE: return "__OVERSIZE__"
-    return str(path)
+    try: entries = [p for p in d.iterdir() if p.suffix.lower() in SUPPORTED_EXT]
+    except OSError: return None
+    best, best_st = None, None
+    for p in entries:
+        try: st = p.stat()
+        except OSError: continue
+        if not stat.S_ISREG(st.st_mode): continue
+        if best_st is None or st.st_mtime > best_st.st_mtime:
+            best, best_st = p, st
+    if best is None: return None
+    if best_st.st_size > MAX_SIZE: return "__OVERSIZE__"
+    return str(best)
 
 def handle_message(_message_text: str = "", policy_path: str | None = None) -> str:
     """